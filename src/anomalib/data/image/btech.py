@@ -10,7 +10,10 @@ extracts the dataset and create PyTorch data objects.
 # SPDX-License-Identifier: Apache-2.0
 
 import logging
+import multiprocessing
+import os
 import shutil
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import albumentations as A  # noqa: N812
@@ -44,6 +47,19 @@ DOWNLOAD_INFO = DownloadInfo(
 CATEGORIES = ("01", "02", "03")
 
 
+def _convert_bmp_to_png(filename: Path) -> None:
+    """Convert a single bmp image to png and remove the original file.
+
+    Defined at module level so that it can be dispatched to worker processes.
+
+    Args:
+        filename (Path): Path to the bmp image.
+    """
+    image = cv2.imread(str(filename))
+    cv2.imwrite(str(filename.with_suffix(".png")), image)
+    filename.unlink()
+
+
 def make_btech_dataset(path: Path, split: str | Split | None = None) -> DataFrame:
     """Create BTech samples by parsing the BTech data file structure.
 
@@ -361,6 +377,10 @@ class BTech(AnomalibDataModule):
                     ├── 01
                     ├── 02
                     └── 03
+
+        Note:
+            The bmp to png conversion runs in ``spawn`` worker processes, so scripts calling this method must guard
+            their entry point with ``if __name__ == "__main__":``.
         """
         if (self.root / self.category).is_dir():
             logger.info("Found the dataset.")
@@ -371,7 +391,36 @@ class BTech(AnomalibDataModule):
             logger.info("Renaming the dataset directory")
             shutil.move(src=str(self.root.parent / "BTech_Dataset_transformed"), dst=str(self.root))
             logger.info("Convert the bmp formats to png to have consistent image extensions")
-            for filename in tqdm(self.root.glob("**/*.bmp"), desc="Converting bmp to png"):
-                image = cv2.imread(str(filename))
-                cv2.imwrite(str(filename.with_suffix(".png")), image)
-                filename.unlink()
+            self._convert_bmp_files(self.root)
+
+    @staticmethod
+    def _convert_bmp_files(root: Path, num_workers: int | None = None) -> None:
+        """Convert all bmp images below ``root`` to png.
+
+        Each conversion is independent, so the work is spread over a pool of worker processes. The workers are
+        started with ``spawn`` rather than forked from a parent that may already run torch or OpenCV threads.
+        As with any ``spawn`` based pool, scripts that trigger the conversion must guard their entry point with
+        ``if __name__ == "__main__":``.
+
+        Args:
+            root (Path): Root folder of the dataset.
+            num_workers (int | None, optional): Number of worker processes. When ``1``, the images are converted
+                serially in the calling process. Defaults to ``os.cpu_count()``.
+        """
+        filenames = list(root.glob("**/*.bmp"))
+        num_workers = num_workers or os.cpu_count() or 1
+        if num_workers == 1:
+            for filename in tqdm(filenames, desc="Converting bmp to png"):
+                _convert_bmp_to_png(filename)
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=num_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            for _ in tqdm(
+                executor.map(_convert_bmp_to_png, filenames, chunksize=8),
+                total=len(filenames),
+                desc="Converting bmp to png",
+            ):
+                pass
@@ -18,6 +18,7 @@ Reference:
 # SPDX-License-Identifier: Apache-2.0
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import albumentations as A  # noqa: N812
@@ -70,9 +71,11 @@ def is_mask_anomalous(path: str) -> int:
         1
     """
     img_arr = imread(path)
-    if np.all(img_arr == 0):
-        return 0
-    return 1
+    if img_arr is None:
+        msg = f"Could not read mask file: {path}"
+        raise RuntimeError(msg)
+    # test for any non-zero pixel without materializing an intermediate boolean array
+    return int(np.any(img_arr))
 
 
 def make_kolektor_dataset(
@@ -120,9 +123,14 @@ def make_kolektor_dataset(
     """
     root = validate_path(root)
 
-    # Get list of images and masks
-    samples_list = [(str(root),) + f.parts[-2:] for f in root.glob(r"**/*") if f.suffix == ".jpg"]
-    masks_list = [(str(root),) + f.parts[-2:] for f in root.glob(r"**/*") if f.suffix == ".bmp"]
+    # Get list of images and masks from a single traversal of the dataset directory
+    samples_list = []
+    masks_list = []
+    for f in root.glob(r"**/*"):
+        if f.suffix == ".jpg":
+            samples_list.append((str(root),) + f.parts[-2:])
+        elif f.suffix == ".bmp":
+            masks_list.append((str(root),) + f.parts[-2:])
 
     if not samples_list:
         msg = f"Found 0 images in {root}"
@@ -144,7 +152,9 @@ def make_kolektor_dataset(
     samples["mask_path"] = masks.image_path.to_numpy()
 
     # Use is_good func to configure the label_index
-    samples["label_index"] = samples["mask_path"].apply(is_mask_anomalous)
+    # Reading the masks is I/O bound and releases the GIL, so the masks are read concurrently
+    with ThreadPoolExecutor() as executor:
+        samples["label_index"] = list(executor.map(is_mask_anomalous, samples.mask_path))
     samples.label_index = samples.label_index.astype(int)
 
     # Use label indexes to label data
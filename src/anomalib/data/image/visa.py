@@ -363,16 +363,19 @@ class Visa(AnomalibDataModule):
                 category, split, label, image_path, mask_path = row
                 label = "good" if label == "normal" else "bad"
                 image_name = image_path.split("/")[-1]
-                mask_name = mask_path.split("/")[-1]
 
                 img_src_path = self.root / image_path
-                msk_src_path = self.root / mask_path
                 img_dst_path = self.split_root / category / split / label / image_name
-                msk_dst_path = self.split_root / category / "ground_truth" / label / mask_name
 
                 shutil.copyfile(img_src_path, img_dst_path)
                 if split == "test" and label == "bad":
-                    mask = cv2.imread(str(msk_src_path))
+                    # only anomalous test images have a mask, so the mask paths are resolved for those rows only
+                    mask_name = mask_path.split("/")[-1]
+                    msk_src_path = self.root / mask_path
+                    msk_dst_path = self.split_root / category / "ground_truth" / label / mask_name
+
+                    # masks are consumed as single-channel images, so skip the expansion to three channels
+                    mask = cv2.imread(str(msk_src_path), cv2.IMREAD_GRAYSCALE)
 
                     # binarize mask
                     mask[mask != 0] = 255
@@ -147,7 +147,9 @@ class Augmenter:
                 masks_list.append(torch.zeros((1, height, width)))
             else:
                 anomaly_source_path = (
-                    random.sample(self.anomaly_source_paths, 1)[0] if len(self.anomaly_source_paths) > 0 else None
+                    random.choice(self.anomaly_source_paths)  # noqa: S311
+                    if len(self.anomaly_source_paths) > 0
+                    else None
                 )
                 perturbation, mask = self.generate_perturbation(height, width, anomaly_source_path)
                 perturbations_list.append(torch.Tensor(perturbation).permute((2, 0, 1)))
@@ -69,10 +69,10 @@ def boxes_to_masks(boxes: list[torch.Tensor], image_size: tuple[int, int]) -> to
         Tensor: torch.Tensor of shape (B, H, W) in which each slice is a binary mask showing the pixels contained by a
             bounding box.
     """
-    masks = torch.zeros((len(boxes), *image_size)).to(boxes[0].device)
+    masks = torch.zeros((len(boxes), *image_size), device=boxes[0].device)
     for im_idx, im_boxes in enumerate(boxes):
-        for box in im_boxes:
-            x_1, y_1, x_2, y_2 = box.int()
+        # fetch the coordinates once per image instead of indexing the tensor for every box
+        for x_1, y_1, x_2, y_2 in im_boxes.int().tolist():
             masks[im_idx, y_1 : y_2 + 1, x_1 : x_2 + 1] = 1
     return masks
 
@@ -345,7 +345,6 @@ def read_image(path: str | Path, image_size: int | tuple[int, int] | None = None
     """
     path = path if isinstance(path, str) else str(path)
     image = cv2.imread(path)
-    image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
 
     if image_size:
         # This part is optional, where the user wants to quickly resize the image
@@ -354,7 +353,8 @@ def read_image(path: str | Path, image_size: int | tuple[int, int] | None = None
         height, width = get_image_height_and_width(image_size)
         image = cv2.resize(image, dsize=(width, height), interpolation=cv2.INTER_AREA)
 
-    return image
+    # Resizing is channel-wise, so the channel order is converted after it, on the (typically) smaller buffer.
+    return cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
 
 
 def read_depth_image(path: str | Path) -> np.ndarray:
@@ -76,8 +76,7 @@ def convert_video(input_path: Path, output_path: Path, codec: str = "MP4V") -> N
         output_path (Path): Path to the target output video.
         codec (str): fourcc code of the codec that will be used for compression of the output file.
     """
-    if not output_path.parent.exists():
-        output_path.parent.mkdir(parents=True)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
 
     # create video reader for input file
     video_reader = cv2.VideoCapture(str(input_path))
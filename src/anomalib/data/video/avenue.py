@@ -18,6 +18,7 @@ __all__ = ["Avenue", "AvenueDataset", "make_avenue_dataset"]
 
 import logging
 import math
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from shutil import move
 from typing import TYPE_CHECKING
@@ -479,10 +480,29 @@ class Avenue(AnomalibVideoDataModule):
         if not all(folder.exists() for folder in mask_folders):
             # convert mask files to images
             logger.info("converting mat files to .png format.")
-            for mat_file, mask_folder in zip(mat_files, mask_folders, strict=True):
-                mat = scipy.io.loadmat(mat_file)
-                mask_folder.mkdir(parents=True, exist_ok=True)
-                masks = mat["volLabel"].squeeze()
-                for idx, mask in enumerate(masks):
-                    filename = (mask_folder / str(idx).zfill(int(math.log10(len(masks)) + 1))).with_suffix(".png")
-                    cv2.imwrite(str(filename), mask)
+            # Frames of the previous volume are written by a background thread while the next .mat file is loaded.
+            # At most one volume is in flight, which keeps memory usage bounded.
+            with ThreadPoolExecutor(max_workers=1) as writer:
+                pending: Future | None = None
+                for mat_file, mask_folder in zip(mat_files, mask_folders, strict=True):
+                    # only the label volume is needed, so skip decoding the other variables in the file
+                    mat = scipy.io.loadmat(mat_file, variable_names=["volLabel"])
+                    mask_folder.mkdir(parents=True, exist_ok=True)
+                    masks = mat["volLabel"].squeeze()
+                    if pending is not None:
+                        pending.result()
+                    pending = writer.submit(Avenue._write_masks, masks, mask_folder)
+                if pending is not None:
+                    pending.result()
+
+    @staticmethod
+    def _write_masks(masks: np.ndarray, mask_folder: Path) -> None:
+        """Write the frames of a mask volume to separate .png files.
+
+        Args:
+            masks (np.ndarray): Mask frames of a single video.
+            mask_folder (Path): Folder to which the mask frames will be written.
+        """
+        for idx, mask in enumerate(masks):
+            filename = (mask_folder / str(idx).zfill(int(math.log10(len(masks)) + 1))).with_suffix(".png")
+            cv2.imwrite(str(filename), mask)
@@ -5,6 +5,8 @@
 
 from pathlib import Path
 
+import cv2
+import numpy as np
 import pytest
 
 from anomalib import TaskType
@@ -31,3 +33,22 @@ class TestBTech(_TestAnomalibImageDatamodule):
         _datamodule.setup()
 
         return _datamodule
+
+
+
+class TestConvertBmpFiles:
+    """Tests for ``BTech._convert_bmp_files``."""
+
+    @pytest.mark.parametrize("num_workers", [1, 2])
+    def test_convert_bmp_files(self, tmp_path: Path, num_workers: int) -> None:
+        """Test that bmp images are converted to png and the bmp files are removed, serially and in a pool."""
+        image = np.full((8, 8, 3), 128, dtype=np.uint8)
+        for name in ("train/good/000.bmp", "test/ko/001.bmp"):
+            (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+            cv2.imwrite(str(tmp_path / name), image)
+
+        BTech._convert_bmp_files(tmp_path, num_workers=num_workers)  # noqa: SLF001
+
+        assert not list(tmp_path.glob("**/*.bmp"))
+        for name in ("train/good/000.png", "test/ko/001.png"):
+            assert np.array_equal(cv2.imread(str(tmp_path / name)), image)
@@ -5,10 +5,13 @@
 
 from pathlib import Path
 
+import cv2
+import numpy as np
 import pytest
 
 from anomalib import TaskType
 from anomalib.data import Kolektor
+from anomalib.data.image.kolektor import is_mask_anomalous
 from tests.unit.data.base.image import _TestAnomalibImageDatamodule
 
 
@@ -30,3 +33,40 @@ class TestKolektor(_TestAnomalibImageDatamodule):
         _datamodule.setup()
 
         return _datamodule
+
+
+class TestIsMaskAnomalous:
+    """Tests for ``is_mask_anomalous`` function."""
+
+    def test_all_zero_mask(self, tmp_path: Path) -> None:
+        """Test that an all-zero mask is labelled normal."""
+        mask_path = tmp_path / "mask.bmp"
+        cv2.imwrite(str(mask_path), np.zeros((8, 8), dtype=np.uint8))
+        assert is_mask_anomalous(str(mask_path)) == 0
+
+    def test_non_zero_mask(self, tmp_path: Path) -> None:
+        """Test that a mask with a defect region is labelled anomalous."""
+        mask = np.zeros((8, 8), dtype=np.uint8)
+        mask[2:4, 2:4] = 255
+        mask_path = tmp_path / "mask.bmp"
+        cv2.imwrite(str(mask_path), mask)
+        assert is_mask_anomalous(str(mask_path)) == 1
+
+    def test_rgba_mask_ignores_alpha(self, tmp_path: Path) -> None:
+        """Test that the alpha channel of an opaque mask does not make it anomalous."""
+        mask = np.zeros((8, 8, 4), dtype=np.uint8)
+        mask[..., 3] = 255
+        mask_path = tmp_path / "mask.png"
+        cv2.imwrite(str(mask_path), mask)
+        assert is_mask_anomalous(str(mask_path)) == 0
+
+        mask[2:4, 2:4, :3] = 255
+        cv2.imwrite(str(mask_path), mask)
+        assert is_mask_anomalous(str(mask_path)) == 1
+
+    def test_unreadable_mask(self, tmp_path: Path) -> None:
+        """Test that an unreadable mask raises an error instead of being labelled."""
+        mask_path = tmp_path / "mask.bmp"
+        mask_path.write_bytes(b"not an image")
+        with pytest.raises(RuntimeError, match=r"Could not read mask file: *"):
+            is_mask_anomalous(str(mask_path))
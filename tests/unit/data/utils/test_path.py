@@ -8,7 +8,7 @@ from tempfile import TemporaryDirectory
 
 import pytest
 
-from anomalib.data.utils.path import validate_path
+from anomalib.data.utils.path import _prepare_files_labels, validate_path
 
 
 class TestValidatePath:
@@ -79,3 +79,26 @@ class TestValidatePath:
             Path(tmp_dir).chmod(0o222)  # Remove read and execute permission
             with pytest.raises(PermissionError, match=r"Read or execute permissions denied for the path:*"):
                 validate_path(tmp_dir, base_dir=Path(tmp_dir))
+
+
+class TestPrepareFilesLabels:
+    """Tests for ``_prepare_files_labels`` function."""
+
+    def test_collects_image_files_recursively(self, tmp_path: Path) -> None:
+        """Test ``_prepare_files_labels`` returns nested image files, skipping directories and hidden files."""
+        (tmp_path / "nested").mkdir()
+        (tmp_path / "folder.png").mkdir()
+        (tmp_path / ".hidden").mkdir()
+        for file_path in ("000.png", "nested/001.png", "nested/002.txt", ".hidden/003.png", "nested/.004.png"):
+            (tmp_path / file_path).touch()
+
+        filenames, labels = _prepare_files_labels(tmp_path, path_type="normal", extensions=(".png",))
+
+        assert sorted(filenames) == [tmp_path / "000.png", tmp_path / "nested/001.png"]
+        assert labels == ["normal", "normal"]
+
+    def test_no_files_found(self, tmp_path: Path) -> None:
+        """Test ``_prepare_files_labels`` raises RuntimeError when no files with the given extensions are found."""
+        (tmp_path / "000.txt").touch()
+        with pytest.raises(RuntimeError, match=r"Found 0 normal images in *"):
+            _prepare_files_labels(tmp_path, path_type="normal", extensions=(".png",))
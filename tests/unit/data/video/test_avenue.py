@@ -5,7 +5,9 @@
 
 from pathlib import Path
 
+import numpy as np
 import pytest
+from scipy.io import savemat
 
 from anomalib import TaskType
 from anomalib.data import Avenue
@@ -32,3 +34,42 @@ class TestAvenue(_TestAnomalibVideoDatamodule):
         _datamodule.setup()
 
         return _datamodule
+
+
+class TestConvertMasks:
+    """Tests for ``Avenue._convert_masks``."""
+
+    @staticmethod
+    def _write_mat_files(gt_dir: Path, lengths: tuple[int, ...]) -> None:
+        """Write one ``.mat`` label volume per entry of ``lengths``, with the given number of frames."""
+        masks_dir = gt_dir / "testing_label_mask"
+        masks_dir.mkdir(parents=True)
+        for video_idx, length in enumerate(lengths):
+            vol_label = np.empty((1, length), dtype=object)
+            for frame_idx in range(length):
+                vol_label[0, frame_idx] = np.zeros((8, 8), dtype=np.uint8)
+            vol_label[0, 0][2:4, 2:4] = 1
+            savemat(masks_dir / f"{video_idx + 1}_label.mat", {"volLabel": vol_label, "other": np.ones(4)})
+
+    def test_convert_masks(self, tmp_path: Path) -> None:
+        """Test that every volume is written to its own folder with one png per frame."""
+        self._write_mat_files(tmp_path, lengths=(3, 12))
+
+        Avenue._convert_masks(tmp_path)  # noqa: SLF001
+
+        masks_dir = tmp_path / "testing_label_mask"
+        assert sorted(path.name for path in (masks_dir / "1_label").iterdir()) == ["0.png", "1.png", "2.png"]
+        assert sorted(path.name for path in (masks_dir / "2_label").iterdir()) == [f"{idx:02}.png" for idx in range(12)]
+
+    def test_write_error_is_raised(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that an error raised in the writer thread reaches the caller."""
+        self._write_mat_files(tmp_path, lengths=(3, 3))
+
+        def _failing_write_masks(masks: np.ndarray, mask_folder: Path) -> None:
+            del masks, mask_folder
+            msg = "write failed"
+            raise OSError(msg)
+
+        monkeypatch.setattr(Avenue, "_write_masks", staticmethod(_failing_write_masks))
+        with pytest.raises(OSError, match="write failed"):
+            Avenue._convert_masks(tmp_path)  # noqa: SLF001